@@ -1,5 +1,6 @@
 import streamlit as st
 
+from cache import cache_stats, clear_all_caches
 from data_loader import load_data, get_all_tags, filter_data, filter_low_data
 from data_processor import prepare_analysis_type_scatter_data
 from visualizations import create_main_scatter_plot
@@ -106,6 +107,13 @@ You can also select a specific tag to explore it in more detail. The data comes
     with st.expander('All Tags'):
         st.markdown(', '.join(get_all_tags(raw_df)))
 
+    # Cache metrics for operators, open the app with ?cache_stats to show them
+    if "cache_stats" in st.query_params:
+        with st.sidebar.expander("Cache Stats", expanded=True):
+            if st.button("Clear Caches"):
+                clear_all_caches()
+            st.dataframe(cache_stats(), hide_index=True)
+
 
 if __name__ == "__main__":
     main()
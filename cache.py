@@ -0,0 +1,182 @@
+import functools
+import hashlib
+import pickle
+import threading
+import time
+from collections import OrderedDict
+
+import pandas as pd
+
+MiB = 2 ** 20
+
+# Like st.cache_data, large DataFrames are keyed by a fixed sample of their rows
+HASH_SAMPLE_THRESHOLD = 50_000
+HASH_SAMPLE_ROWS = 10_000
+
+# All bounded caches by function name, so operators can inspect them in one place
+_caches = {}
+
+
+def _hash_arg(value, hasher):
+    """Feed a function argument into the hasher (DataFrames by content, like st.cache_data)."""
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        hasher.update(type(value).__name__.encode())
+        hasher.update(repr(value.shape).encode())
+        if isinstance(value, pd.DataFrame):
+            hasher.update(repr(list(value.columns)).encode())
+        if len(value) >= HASH_SAMPLE_THRESHOLD:
+            value = value.sample(n=HASH_SAMPLE_ROWS, random_state=0)
+        hasher.update(pd.util.hash_pandas_object(value, index=True).values.tobytes())
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        hasher.update(type(value).__name__.encode())
+        items = sorted(value, key=repr) if isinstance(value, (set, frozenset)) else value
+        for item in items:
+            _hash_arg(item, hasher)
+    else:
+        hasher.update(repr(value).encode())
+    hasher.update(b"|")
+
+
+def _size_of(value):
+    """Approximate memory held by a cached value in bytes."""
+    # Cached frames are filtered or derived from the loaded dataset and share its string
+    # objects, so text cells count as references; deep=True would double count them and
+    # takes longer than many of the computations being cached
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage().sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage())
+    return len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+class BoundedCache:
+    """Thread-safe LRU cache limited by total size in bytes and number of entries."""
+
+    def __init__(self, name, max_bytes, max_entries=None, ttl=None):
+        self.name = name
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.ttl = ttl
+
+        self._entries = OrderedDict()  # key -> (value, size, created_at)
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.bytes = 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self.ttl is not None and time.monotonic() - entry[2] > self.ttl:
+                self._remove(key)
+                self.evictions += 1
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key, value):
+        size = _size_of(value)
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            # Values larger than the whole budget are returned but never stored
+            if size > self.max_bytes:
+                return
+
+            self._entries[key] = (value, size, time.monotonic())
+            self.bytes += size
+
+            while self.bytes > self.max_bytes or (
+                    self.max_entries is not None and len(self._entries) > self.max_entries):
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "Function": self.name,
+                "Entries": len(self._entries),
+                "Max entries": self.max_entries,
+                "MiB": self.bytes / MiB,
+                "Max MiB": self.max_bytes / MiB,
+                "Hits": self.hits,
+                "Misses": self.misses,
+                "Hit rate": self.hits / lookups if lookups else 0.0,
+                "Evictions": self.evictions,
+            }
+
+    def _remove(self, key):
+        _, size, _ = self._entries.pop(key)
+        self.bytes -= size
+
+
+def bounded_cache(max_mb, max_entries=None, ttl=None):
+    """
+    Drop-in replacement for st.cache_data with a per-function memory budget.
+
+    Results are keyed by the arguments (DataFrames are hashed by content) and
+    evicted in least-recently-used order once the cached results of the function
+    exceed max_mb megabytes or max_entries entries. Entries older than ttl
+    seconds are recomputed. DataFrames and Series are returned as copies, so callers
+    can mutate them; other values (e.g. figures) are shared between callers.
+
+    Args:
+        max_mb      : Memory budget of the function's cached results in MiB
+        max_entries : Optional limit on the number of cached results
+        ttl         : Optional lifetime of a cached result in seconds
+    """
+
+    def decorator(func):
+        cache = BoundedCache(func.__qualname__, int(max_mb * MiB), max_entries, ttl)
+        _caches[cache.name] = cache
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            hasher = hashlib.sha256()
+            _hash_arg(args, hasher)
+            _hash_arg(sorted(kwargs.items()), hasher)
+            key = hasher.hexdigest()
+
+            entry = cache.get(key)
+            if entry is None:
+                value = func(*args, **kwargs)
+                cache.put(key, value)
+            else:
+                value = entry[0]
+
+            if isinstance(value, (pd.DataFrame, pd.Series)):
+                return value.copy()
+            return value
+
+        wrapper.cache = cache
+        wrapper.clear = cache.clear
+        return wrapper
+
+    return decorator
+
+
+def cache_stats():
+    """Hit/miss/eviction/size metrics of all bounded caches as a DataFrame."""
+    return pd.DataFrame([cache.stats() for cache in _caches.values()])
+
+
+def clear_all_caches():
+    """Drop all bounded cache entries, st.cache_data.clear() does not reach them."""
+    for cache in _caches.values():
+        cache.clear()
@@ -2,6 +2,8 @@ import numpy as np
 import pandas as pd
 import streamlit as st
 
+from cache import bounded_cache
+
 
 @st.cache_data
 def load_data():
@@ -52,6 +54,12 @@ def filter_data(input_df):
     for col, default_value in numeric_columns.items():
         df[col] = pd.to_numeric(df[col], errors='coerce').fillna(default_value)
 
+    # Parse owner ranges like "20000 - 50000" into numeric bounds and midpoint
+    owners = df['Estimated owners'].astype(str).str.extract(r'(\d+)\s*-\s*(\d+)')
+    df['Owners_lower'] = pd.to_numeric(owners[0], errors='coerce').fillna(0).astype('int64')
+    df['Owners_upper'] = pd.to_numeric(owners[1], errors='coerce').fillna(0).astype('int64')
+    df['Owners_mid'] = (df['Owners_lower'] + df['Owners_upper']) // 2
+
     # Calculate derived metrics
     df['Total_reviews'] = df['Positive'] + df['Negative']
 
@@ -81,12 +89,12 @@ def filter_data(input_df):
     return df
 
 
-@st.cache_data
+@bounded_cache(max_mb=256, max_entries=16)
 def filter_year(df, year_range):
     return df[(df['Release_year'] >= year_range[0]) & (df['Release_year'] <= year_range[1])]
 
 
-@st.cache_data
+@bounded_cache(max_mb=512, max_entries=32)
 def filter_low_data(input_df, year_range, number_of_min_reviews, number_of_min_ccu):
     df = input_df.copy()
     df = filter_year(df, year_range)
@@ -1,10 +1,19 @@
-import streamlit as st
+import numpy as np
+import pandas as pd
 
+from cache import bounded_cache
 
-@st.cache_data
+
+@bounded_cache(max_mb=32, max_entries=256)
 def prepare_analysis_type_scatter_data(df, raw_df, all_categories):
     # Explode the analysis_type column (split comma-separated values)
     df_exploded = df.copy()
+
+    # Metrics multiplied by the estimated owners, summed per tag and divided by the owners below
+    df_exploded['Owners_peak_ccu'] = df_exploded['Peak CCU'] * df_exploded['Owners_mid']
+    df_exploded['Owners_review_ratio'] = df_exploded['Review_ratio'] * df_exploded['Owners_mid']
+    df_exploded['Owners_playtime'] = df_exploded['Average playtime forever'] * df_exploded['Owners_mid']
+
     df_exploded['Tags'] = df_exploded['Tags'].str.split(',')
     df_exploded = df_exploded.explode('Tags')
 
@@ -22,7 +31,11 @@ def prepare_analysis_type_scatter_data(df, raw_df, all_categories):
         'Positive': 'sum',  # Total positive reviews
         'Negative': 'sum',  # Total negative reviews
         'Average playtime forever': 'mean',  # Avg playtime
-        'Peak CCU': 'mean'  # Avg peak CCU
+        'Peak CCU': 'mean',  # Avg peak CCU
+        'Owners_mid': 'sum',  # Total estimated owners
+        'Owners_peak_ccu': 'sum',
+        'Owners_review_ratio': 'sum',
+        'Owners_playtime': 'sum',
     }).reset_index()
 
     # Rename columns for clarity
@@ -30,9 +43,17 @@ def prepare_analysis_type_scatter_data(df, raw_df, all_categories):
         'AppID': 'Game_count',
         'Review_ratio': 'Avg_review_ratio',
         'Average playtime forever': 'Avg_playtime',
-        'Peak CCU': 'Avg_peak_ccu'
+        'Peak CCU': 'Avg_peak_ccu',
+        'Owners_mid': 'Total_owners',
     })
 
+    # Owner-weighted means, a game with 10M owners counts more than a game with 10
+    # (NaN for tags without estimated owners, there the weighted mean is undefined)
+    owners = grouped['Total_owners'].replace(0, np.nan)
+    grouped['Owner_weighted_peak_ccu'] = grouped.pop('Owners_peak_ccu') / owners
+    grouped['Owner_weighted_review_ratio_pct'] = grouped.pop('Owners_review_ratio') / owners * 100
+    grouped['Owner_weighted_playtime'] = grouped.pop('Owners_playtime') / owners
+
     # Calculate percentage values for display
     # TODO - which review ratio to use
     grouped['Avg_review_ratio_pct'] = grouped['Avg_review_ratio'] * 100
@@ -63,3 +84,105 @@ def prepare_analysis_type_scatter_data(df, raw_df, all_categories):
     grouped['Total_Game_Count'] = grouped['Total_Game_Count'].fillna(0).astype(int)
 
     return grouped.sort_values('Game_count', ascending=False)
+
+
+@bounded_cache(max_mb=64, max_entries=32)
+def compute_tag_similarity(game_tags, chunk_size=8192):
+    """
+    Similarity between all pairs of tags based on which games they share.
+
+    Each tag is represented by its positive pointwise mutual information (PPMI)
+    with every other tag, so huge tags like "Indie" do not dominate just by size.
+    The cosine similarity of those vectors is returned as a tags × tags DataFrame.
+
+    Args:
+        game_tags  : Series with the comma-separated tags of each game, only this is
+                     passed in so the cache key does not hash the whole frame
+        chunk_size : Number of games turned into a dense indicator matrix at once
+    """
+    # One (game, tag) pair per row
+    tags = game_tags.str.split(',').explode().str.strip()
+    tags = tags[tags.notna() & (tags != '')]
+    game_codes = pd.factorize(tags.index)[0]
+    tag_codes, tag_names = pd.factorize(tags.to_numpy(), sort=True)
+
+    n_games = game_codes.max() + 1 if len(game_codes) else 0
+    n_tags = len(tag_names)
+
+    # Co-occurrence counts as X.T @ X of the game × tag indicator matrix, built in chunks
+    cooccurrence = np.zeros((n_tags, n_tags))
+    order = np.argsort(game_codes, kind='stable')
+    game_codes, tag_codes = game_codes[order], tag_codes[order]
+    bounds = np.searchsorted(game_codes, np.arange(0, n_games + chunk_size, chunk_size))
+
+    for start, (lo, hi) in enumerate(zip(bounds[:-1], bounds[1:])):
+        indicators = np.zeros((chunk_size, n_tags), dtype=np.float32)
+        indicators[game_codes[lo:hi] - start * chunk_size, tag_codes[lo:hi]] = 1
+        cooccurrence += indicators.T @ indicators
+
+    # PPMI = max(0, log(P(a, b) / (P(a) * P(b))))
+    tag_counts = np.diag(cooccurrence)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        pmi = np.log(cooccurrence * n_games / np.outer(tag_counts, tag_counts))
+    ppmi = np.nan_to_num(np.clip(pmi, 0, None), nan=0.0, posinf=0.0)
+    np.fill_diagonal(ppmi, 0)
+
+    # Cosine similarity between the PPMI vectors
+    norms = np.linalg.norm(ppmi, axis=1)
+    norms[norms == 0] = 1
+    unit = ppmi / norms[:, None]
+    similarity = unit @ unit.T
+    np.fill_diagonal(similarity, np.nan)
+
+    return pd.DataFrame(similarity, index=tag_names, columns=tag_names)
+
+
+def get_similar_tags(similarity, tag, k=10):
+    """Top k tags most similar to the given tag, empty if the tag is not in the matrix."""
+    if tag not in similarity.index:
+        return pd.DataFrame(columns=['Tags', 'Similarity'])
+
+    return (
+        similarity.loc[tag]
+        .loc[lambda s: s > 0]
+        .nlargest(k)
+        .rename_axis('Tags')
+        .reset_index(name='Similarity')
+    )
+
+
+def log_range_steps(max_value):
+    """Round values 1, 2, 5, 10, 20, 50, ... up to the first one that covers max_value."""
+    steps = [1]
+    while steps[-1] < max_value or len(steps) < 2:
+        steps.append(steps[-1] * 5 // 2 if str(steps[-1])[0] == '2' else steps[-1] * 2)
+    return steps
+
+
+def bin_games_2d(df, x_col, y_col, x_range, y_range, bins=100):
+    """
+    Count games in a fixed-size 2D histogram with logarithmic bins.
+
+    Only the bins×bins grid leaves the server, so the chart payload does not grow
+    with the number of games. Values below 1 are counted in the first bin.
+
+    Args:
+        df      : DataFrame of games
+        x_col   : Column plotted on the x axis
+        y_col   : Column plotted on the y axis
+        x_range : (min, max) of the x axis in original units, games outside are dropped
+        y_range : (min, max) of the y axis in original units, games outside are dropped
+
+    Returns:
+        counts (bins × bins, rows are y bins), x_edges and y_edges in log10 units
+    """
+    x = np.log10(np.clip(df[x_col].to_numpy(dtype=float), 1, None))
+    y = np.log10(np.clip(df[y_col].to_numpy(dtype=float), 1, None))
+
+    counts, x_edges, y_edges = np.histogram2d(
+        x, y,
+        bins=bins,
+        range=[np.log10(x_range), np.log10(y_range)],
+    )
+
+    return counts.T, x_edges, y_edges
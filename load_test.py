@@ -0,0 +1,398 @@
+"""
+Concurrent-session load test for the Streamlit app.
+
+Starts one ``streamlit run`` server and connects many simulated browser sessions
+to it over Streamlit's websocket protocol. The sessions replay interaction
+scripts (slider drags, highlight changes, clicking a tag in the scatter plot,
+switching tags) and every rerun is timed from sending the widget change until
+the server reports the script run as finished. At the end p50/p95/p99 rerun
+latency, throughput and the RSS of the server process are reported.
+
+All sessions share the server's interpreter, caches and GIL, like real users do.
+The latencies are still a best case: the clients run on the same machine and
+neither network nor browser rendering is included.
+
+Run from the project root (needs ``data/games.csv``):
+    python load_test.py --sessions 20 --iterations 5
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+import urllib.request
+from collections import defaultdict
+
+import numpy as np
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+from tornado.websocket import websocket_connect
+
+MAIN_PAGE = "Main_Overview.py"
+TAG_PAGE = "Tag_Details"
+
+YEAR_SLIDER = "Year Range"
+REVIEWS_SLIDER = "Minimum Amount of Reviews per Game"
+CCU_SLIDER = "Minimum Amount of Peak CCU per Game"
+HIGHLIGHT_SELECT = "Tags to highlight:"
+TAG_SELECT = "Analysis for Tag:"
+
+WIDGET_TYPES = ("slider", "multiselect", "selectbox")
+
+
+async def process_rss_bytes(pid):
+    """Current resident set size of a process, `ps` reports it in KiB on Linux and macOS."""
+    # Run ps without blocking the event loop, the sessions keep reading their messages meanwhile
+    ps = await asyncio.create_subprocess_exec(
+        "ps", "-o", "rss=", "-p", str(pid), stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.DEVNULL
+    )
+    output, _ = await ps.communicate()
+    return int(output.strip()) * 1024 if output.strip() else 0
+
+
+class Session:
+    """One simulated browser tab connected to the server."""
+
+    def __init__(self, url, timeout):
+        self.url = url
+        self.timeout = timeout
+        self.ws = None
+
+        self.pages = {}  # url pathname -> page script hash
+        self.page_hash = ""
+        self.widgets = {}  # label -> widget element proto rendered in the last run
+        self.charts = []  # selectable plotly charts rendered in the last run
+        self.widget_states = {}  # widget id -> WidgetState sent with every rerun, like the browser does
+
+    async def connect(self):
+        self.ws = await websocket_connect(self.url, max_message_size=2 ** 30)
+
+    def close(self):
+        self.ws.close()
+
+    async def rerun(self, *changes, page_hash=None):
+        """Send changed widget states (or a page switch) and wait until the script run finished."""
+        if page_hash is not None:
+            self.page_hash = page_hash
+            self.widget_states = {}
+        for state in changes:
+            self.widget_states[state.id] = state
+
+        back_msg = BackMsg()
+        back_msg.rerun_script.page_script_hash = self.page_hash
+        back_msg.rerun_script.widget_states.widgets.extend(self.widget_states.values())
+        await self.ws.write_message(back_msg.SerializeToString(), binary=True)
+
+        await asyncio.wait_for(self._read_until_finished(), self.timeout)
+
+    async def _read_until_finished(self):
+        widgets = {}
+        charts = []
+        exception = None
+
+        while True:
+            payload = await self.ws.read_message()
+            if payload is None:
+                raise ConnectionError("server closed the websocket")
+
+            msg = ForwardMsg.FromString(payload)
+            kind = msg.WhichOneof("type")
+
+            if kind == "new_session":
+                # A new script run started, e.g. after st.switch_page, forget what the previous one rendered
+                widgets = {}
+                charts = []
+                self.page_hash = msg.new_session.page_script_hash
+                self._update_pages(msg.new_session.app_pages)
+            elif kind == "navigation":
+                self._update_pages(msg.navigation.app_pages)
+            elif kind == "delta" and msg.delta.WhichOneof("type") == "new_element":
+                element = msg.delta.new_element
+                element_type = element.WhichOneof("type")
+                if element_type in WIDGET_TYPES:
+                    widget = getattr(element, element_type)
+                    widgets[widget.label] = widget
+                elif element_type == "plotly_chart" and element.plotly_chart.id:
+                    charts.append(element.plotly_chart)
+                elif element_type == "exception" and not element.exception.is_warning:
+                    exception = f"{element.exception.type}: {element.exception.message}"
+            elif kind == "script_finished" and msg.script_finished != ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+                break
+
+        self.widgets = widgets
+        self.charts = charts
+        rendered_ids = {widget.id for widget in widgets.values()} | {chart.id for chart in charts}
+        self.widget_states = {id_: state for id_, state in self.widget_states.items() if id_ in rendered_ids}
+
+        if exception:
+            raise RuntimeError(exception)
+
+    def _update_pages(self, app_pages):
+        for page in app_pages:
+            self.pages[page.url_pathname] = page.page_script_hash
+
+    # --- Widget helpers ---
+
+    @staticmethod
+    def double_array_state(widget, values):
+        state = WidgetState(id=widget.id)
+        state.double_array_value.data.extend(values)
+        return state
+
+    @staticmethod
+    def string_array_state(widget, values):
+        state = WidgetState(id=widget.id)
+        state.string_array_value.data.extend(values)
+        return state
+
+    @staticmethod
+    def string_state(widget, value):
+        return WidgetState(id=widget.id, string_value=value)
+
+    def current_value(self, widget):
+        state = self.widget_states.get(widget.id)
+        if state is None:
+            return list(widget.default)
+        return list(getattr(state, state.WhichOneof("value")).data)
+
+
+# --- Interaction steps ---
+# Each step performs exactly one rerun and returns a name used to group timings.
+
+async def step_initial_load(session, rng):
+    await session.rerun()
+    return "initial load"
+
+
+async def step_drag_slider(session, rng, label):
+    slider = session.widgets[label]
+    value = session.current_value(slider)
+
+    if len(value) == 2:
+        # Drag one handle of the year range towards the other one
+        low, high = value
+        if rng.random() < 0.5:
+            low = min(low + rng.randint(1, 3), high)
+        else:
+            high = max(high - rng.randint(1, 3), low)
+        value = [low, high]
+    else:
+        value = [min(slider.max, max(slider.min, value[0] + rng.randint(-5, 5)))]
+
+    await session.rerun(session.double_array_state(slider, value))
+    return f"slider: {label}"
+
+
+async def step_highlight(session, rng):
+    multiselect = session.widgets[HIGHLIGHT_SELECT]
+    options = list(multiselect.options)
+    tags = rng.sample(options, k=min(len(options), rng.randint(0, 3)))
+
+    await session.rerun(session.string_array_state(multiselect, tags))
+    return "highlight"
+
+
+async def step_click_tag(session, rng):
+    # Same selection event the browser sends when a point in the scatter plot is clicked
+    tag = rng.choice(list(session.widgets[HIGHLIGHT_SELECT].options))
+    scatter = session.charts[0]
+    selection = {"selection": {"points": [{"hovertext": tag}], "point_indices": [0], "box": [], "lasso": []}}
+
+    await session.rerun(session.string_state(scatter, json.dumps(selection)))
+
+    # The chart id depends on the figure, if the server rendered a different one the click is dropped
+    if session.page_hash != session.pages.get(TAG_PAGE):
+        raise RuntimeError(f"click on '{tag}' in the scatter plot did not navigate to {TAG_PAGE}")
+    return "click tag in scatter"
+
+
+async def step_switch_tag(session, rng):
+    selectbox = session.widgets[TAG_SELECT]
+    await session.rerun(session.string_state(selectbox, rng.choice(list(selectbox.options))))
+    return "switch tag"
+
+
+async def step_back_to_overview(session, rng):
+    main_hash = next(page_hash for name, page_hash in session.pages.items() if name != TAG_PAGE)
+    await session.rerun(page_hash=main_hash)
+    return "open overview"
+
+
+# --- Interaction scripts ---
+
+def script_slider_drags(rng):
+    for label in (YEAR_SLIDER, REVIEWS_SLIDER, CCU_SLIDER):
+        for _ in range(rng.randint(3, 6)):
+            yield lambda session, label=label: step_drag_slider(session, rng, label)
+
+
+def script_highlights(rng):
+    for _ in range(rng.randint(3, 6)):
+        yield lambda session: step_highlight(session, rng)
+
+
+def script_tag_page(rng):
+    yield lambda session: step_click_tag(session, rng)
+    for _ in range(rng.randint(2, 4)):
+        yield lambda session: step_switch_tag(session, rng)
+    yield lambda session: step_drag_slider(session, rng, YEAR_SLIDER)
+    yield lambda session: step_back_to_overview(session, rng)
+
+
+SCRIPTS = {
+    "sliders": script_slider_drags,
+    "highlights": script_highlights,
+    "tag_page": script_tag_page,
+}
+
+
+async def run_session(session_id, args, url, start_barrier):
+    """Replay random interaction scripts in one session, returns (latencies, error, end time)."""
+    rng = random.Random(args.seed + session_id)
+    latencies = defaultdict(list)
+    error = None
+
+    session = Session(url, args.timeout)
+    await session.connect()
+    await start_barrier.wait()
+
+    try:
+        steps = [lambda s: step_initial_load(s, rng)]
+        for _ in range(args.iterations):
+            steps.extend(SCRIPTS[rng.choice(args.scripts)](rng))
+
+        for step in steps:
+            start = time.perf_counter()
+            name = await step(session)
+            latencies[name].append(time.perf_counter() - start)
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+    finally:
+        session.close()
+
+    return dict(latencies), error, time.perf_counter()
+
+
+async def sample_rss(pid, samples, interval=0.5):
+    while True:
+        samples.append(await process_rss_bytes(pid))
+        await asyncio.sleep(interval)
+
+
+async def run_load_test(args, url, server_pid):
+    # Warm up the server caches (CSV load, preprocessing) so they do not skew the numbers
+    warm_up = Session(url, args.timeout)
+    await warm_up.connect()
+    await warm_up.rerun()
+    warm_up.close()
+
+    rss_before = await process_rss_bytes(server_pid)
+    rss_samples = []
+    sampler = asyncio.create_task(sample_rss(server_pid, rss_samples))
+
+    # Start the clock once every session is connected
+    start_barrier = asyncio.Barrier(args.sessions + 1)
+    tasks = [asyncio.create_task(run_session(session_id, args, url, start_barrier))
+             for session_id in range(args.sessions)]
+    await start_barrier.wait()
+    start = time.perf_counter()
+    sessions = await asyncio.gather(*tasks)
+
+    sampler.cancel()
+    rss_samples.append(await process_rss_bytes(server_pid))
+
+    wall_time = max(end for _, _, end in sessions) - start
+    return sessions, wall_time, rss_before, rss_samples
+
+
+def print_report(sessions, wall_time, rss_before, rss_samples):
+    latencies = defaultdict(list)
+    for session_latencies, _, _ in sessions:
+        for name, values in session_latencies.items():
+            latencies[name].extend(values)
+    all_latencies = [t for values in latencies.values() for t in values]
+    errors = [(session_id, error) for session_id, (_, error, _) in enumerate(sessions) if error]
+
+    print()
+    print(f"{'Step':<48} {'Reruns':>7} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'max ms':>9}")
+    rows = sorted(latencies.items()) + [("TOTAL", all_latencies)]
+    for name, values in rows:
+        if not values:
+            continue
+        p50, p95, p99 = np.percentile(values, [50, 95, 99]) * 1000
+        print(f"{name:<48} {len(values):>7} {p50:>9.1f} {p95:>9.1f} {p99:>9.1f} {max(values) * 1000:>9.1f}")
+
+    print()
+    print(f"Sessions:   {len(sessions)} on one server")
+    print(f"Wall time:  {wall_time:.1f} s")
+    print(f"Throughput: {len(all_latencies) / wall_time:.2f} reruns/s")
+    print(f"Server RSS: {rss_before / 2 ** 20:.1f} MiB after warm-up -> {rss_samples[-1] / 2 ** 20:.1f} MiB at the end "
+          f"(+{(rss_samples[-1] - rss_before) / 2 ** 20:.1f} MiB, peak {max(rss_samples) / 2 ** 20:.1f} MiB)")
+    print("Best case: clients run on the same machine, network and browser rendering are not included.")
+
+    if errors:
+        print()
+        print(f"❌ {len(errors)} session(s) failed:")
+        for session_id, message in errors:
+            print(f"  session {session_id}: {message}")
+
+
+def start_server(port, timeout, log):
+    server = subprocess.Popen(
+        [
+            sys.executable, "-m", "streamlit", "run", MAIN_PAGE,
+            "--server.headless", "true",
+            "--server.port", str(port),
+            "--server.fileWatcherType", "none",
+            "--browser.gatherUsageStats", "false",
+        ],
+        stdout=log,
+        stderr=subprocess.STDOUT,
+    )
+
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError(f"streamlit server exited with code {server.returncode}")
+        try:
+            with urllib.request.urlopen(f"http://localhost:{port}/_stcore/health") as response:
+                if response.status == 200:
+                    return server
+        except OSError:
+            time.sleep(0.2)
+
+    server.terminate()
+    raise RuntimeError(f"streamlit server did not start within {timeout}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent-session load test for the Streamlit app")
+    parser.add_argument("--sessions", type=int, default=10, help="number of simultaneous sessions")
+    parser.add_argument("--iterations", type=int, default=5, help="interaction scripts replayed per session")
+    parser.add_argument("--scripts", nargs="+", choices=sorted(SCRIPTS), default=sorted(SCRIPTS),
+                        help="interaction scripts to pick from")
+    parser.add_argument("--timeout", type=float, default=60, help="timeout of a single rerun in seconds")
+    parser.add_argument("--port", type=int, default=8599, help="port of the streamlit server started for the test")
+    parser.add_argument("--server-log", help="file to write the server output to, discarded by default")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    with open(args.server_log or os.devnull, "w") as log:
+        server = start_server(args.port, args.timeout, log)
+        try:
+            url = f"ws://localhost:{args.port}/_stcore/stream"
+            sessions, wall_time, rss_before, rss_samples = asyncio.run(run_load_test(args, url, server.pid))
+        finally:
+            server.terminate()
+            server.wait()
+
+    print_report(sessions, wall_time, rss_before, rss_samples)
+    raise SystemExit(1 if any(error for _, error, _ in sessions) else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,7 +5,47 @@ import streamlit as st
 import numpy as np
 
 from data_loader import load_data, get_all_tags, filter_data, filter_low_data
-from visualizations import create_violin_summary, create_games_per_year_bar, create_upset_plot
+from data_processor import compute_tag_similarity, get_similar_tags, log_range_steps, bin_games_2d
+from visualizations import create_violin_summary, create_games_per_year_bar, create_upset_plot, \
+    create_density_heatmap
+
+DENSITY_GRID_SIZE = 100
+
+
+def render_density_view(tag_df, x_col, y_col, x_label, y_label):
+    """
+    Render a per-game density heatmap with range sliders to zoom in.
+
+    Games are binned on the server into a fixed DENSITY_GRID_SIZE² grid, zooming
+    re-bins only the selected range, so the chart stays the same size for any
+    number of games.
+    """
+    x_steps = log_range_steps(tag_df[x_col].max() if not tag_df.empty else 0)
+    y_steps = log_range_steps(tag_df[y_col].max() if not tag_df.empty else 0)
+
+    col1, col2 = st.columns(2)
+    with col1:
+        x_range = st.select_slider(
+            f"{x_label} Range",
+            options=x_steps,
+            value=(x_steps[0], x_steps[-1]),
+            format_func=lambda v: f"{v:,}",
+        )
+    with col2:
+        y_range = st.select_slider(
+            f"{y_label} Range",
+            options=y_steps,
+            value=(y_steps[0], y_steps[-1]),
+            format_func=lambda v: f"{v:,}",
+        )
+
+    if x_range[0] == x_range[1] or y_range[0] == y_range[1]:
+        st.info("Select a range with different start and end values.")
+        return
+
+    counts, x_edges, y_edges = bin_games_2d(tag_df, x_col, y_col, x_range, y_range, bins=DENSITY_GRID_SIZE)
+    fig = create_density_heatmap(counts, x_edges, y_edges, x_label, y_label)
+    st.plotly_chart(fig, config={"responsive": True}, key='game_density')
 
 
 def render_cooccurrence_table(tag_df, selected_tag, column_name, title_label):
@@ -158,6 +198,9 @@ def genre_details_page():
     fig = create_games_per_year_bar(tag_df, selected_tag)
     st.plotly_chart(fig, config={"responsive": True}, key='games_per_year')
 
+    st.subheader(f"Peak CCU vs Total Reviews per Game")
+    render_density_view(tag_df, "Total_reviews", "Peak CCU", "Total Reviews", "Peak CCU")
+
     col1, col2 = st.columns(2)
 
     with col1:
@@ -178,6 +221,16 @@ def genre_details_page():
 
     st.divider()
 
+    st.subheader(f"Tags Similar to '{selected_tag}'")
+    st.caption("Tags that appear together with the same other tags, independent of how many games they have.")
+    similar_tags = get_similar_tags(compute_tag_similarity(df['Tags']), selected_tag, k=10)
+    if similar_tags.empty:
+        st.info("No similar tags found for the selected filters.")
+    else:
+        st.dataframe(similar_tags, hide_index=True)
+
+    st.divider()
+
     st.subheader(f"Tag Intersection {selected_tag}")
     selected_tags_for_upset = [selected_tag] + best_tags[:5]
     selected_tags_for_upset = selected_tags_for_upset[::-1]
@@ -6,6 +6,13 @@ import streamlit as st
 from plotly.subplots import make_subplots
 from upsetplot import UpSet, from_indicators
 
+from cache import bounded_cache
+
+
+def format_or_na(values, fmt):
+    """Format each value with fmt, undefined (NaN) values become "n/a"."""
+    return values.dropna().map(fmt).reindex(values.index, fill_value="n/a")
+
 
 @st.cache_data
 def empty_figure():
@@ -23,7 +30,7 @@ def empty_figure():
     return fig
 
 
-@st.cache_data
+@bounded_cache(max_mb=64, max_entries=256)
 def create_main_scatter_plot(scatter_data, selected_categories):
     if scatter_data.empty:
         return empty_figure()
@@ -34,6 +41,14 @@ def create_main_scatter_plot(scatter_data, selected_categories):
 
     scatter_data['play_hours'] = (scatter_data['Avg_playtime'] // 60).astype(int)
     scatter_data['play_minutes'] = (scatter_data['Avg_playtime'] % 60).astype(int)
+    # Owner-weighted metrics are undefined for tags without estimated owners
+    scatter_data['owner_peak_ccu_text'] = format_or_na(scatter_data['Owner_weighted_peak_ccu'], "{:,.0f}".format)
+    scatter_data['owner_review_ratio_text'] = format_or_na(
+        scatter_data['Owner_weighted_review_ratio_pct'], "{:.1f}%".format
+    )
+    scatter_data['owner_playtime_text'] = format_or_na(
+        scatter_data['Owner_weighted_playtime'], lambda t: f"{int(t // 60)}h {int(t % 60):02d}m"
+    )
 
     # Create scatter plot
     fig = px.scatter(
@@ -49,7 +64,11 @@ def create_main_scatter_plot(scatter_data, selected_categories):
             scatter_data['Total_Game_Count'],
             scatter_data['Game_count'],
             scatter_data['play_hours'],
-            scatter_data['play_minutes']
+            scatter_data['play_minutes'],
+            scatter_data['Total_owners'],
+            scatter_data['owner_peak_ccu_text'],
+            scatter_data['owner_review_ratio_text'],
+            scatter_data['owner_playtime_text']
         ],
         size_max=15,
         color="highlight",
@@ -97,7 +116,11 @@ def create_main_scatter_plot(scatter_data, selected_categories):
             "Total Average Review ratio: %{customdata[0]:.1f}%<br>"
             "Total Reviews: %{customdata[1]:,}<br>"
             "Avg Playtime: %{customdata[6]}h %{customdata[7]:02d}m<br>"
-            "Avg Peak CCU: %{customdata[2]:.0f}<extra></extra>"
+            "Avg Peak CCU: %{customdata[2]:.0f}<br><br>"
+            "Estimated Owners: %{customdata[8]:,.0f}<br>"
+            "Owner-weighted Review Ratio: %{customdata[10]}<br>"
+            "Owner-weighted Playtime: %{customdata[11]}<br>"
+            "Owner-weighted Peak CCU: %{customdata[9]}<extra></extra>"
         )
     )
 
@@ -196,6 +219,43 @@ def create_games_per_year_bar(tag_df, selected_tag):
     return fig
 
 
+def create_density_heatmap(counts, x_edges, y_edges, x_label, y_label):
+    """Plot a 2D histogram from bin_games_2d as a heatmap on log axes."""
+    if counts.sum() == 0:
+        return empty_figure()
+
+    # Color by log10 of the count so single games stay visible next to dense bins, hide empty bins
+    with np.errstate(divide='ignore'):
+        z = np.where(counts > 0, np.log10(counts).round(3), np.nan)
+    max_decade = max(int(np.ceil(np.nanmax(z))), 1)
+
+    fig = go.Figure(go.Heatmap(
+        # Bin edges (one more than cells) so the cells line up exactly with the log axes
+        x=10 ** x_edges,
+        y=10 ** y_edges,
+        z=z,
+        text=counts.astype(int),
+        colorscale="Viridis",
+        zmin=0,
+        colorbar=dict(
+            title="Games",
+            tickvals=list(range(max_decade + 1)),
+            ticktext=[f"{10 ** d:,}" for d in range(max_decade + 1)],
+        ),
+        hovertemplate=(
+            f"{x_label}: ~%{{x:,.0f}}<br>"
+            f"{y_label}: ~%{{y:,.0f}}<br>"
+            "Games: %{text}<extra></extra>"
+        ),
+    ))
+
+    fig.update_xaxes(title_text=f"{x_label} (log scale)", type='log', tickformat=',', showgrid=True)
+    fig.update_yaxes(title_text=f"{y_label} (log scale)", type='log', tickformat=',', showgrid=True)
+    fig.update_layout(height=600)
+
+    return fig
+
+
 def create_upset_plot(df, selected_tags, width=12, height=6):
     if len(df) < 50 or len(selected_tags) < 2:
         fig = plt.figure(figsize=(width, height))